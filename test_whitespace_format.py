@@ -1,8 +1,15 @@
 """Unit tests for whitespace_format module."""
 
 import argparse
+import contextlib
+import io
+import os
+import pathlib
 import re
+import sys
+import tempfile
 import unittest
+import unittest.mock
 
 import whitespace_format
 from whitespace_format import Change
@@ -30,6 +37,31 @@ class TestWhitespaceFormat(unittest.TestCase):
         """Verify that version numbers are the same in all places."""
         self.assertEqual(whitespace_format.VERSION, extract_version_from_pyproject())
 
+    def test_color_print(self):
+        """Tests color_print() function."""
+        message = "[BOLD][RED]hello[RESET_ALL] [LIGHT_RED]world[RESET_ALL] [NOT_A_COLOR]"
+        for color, expected_output in [
+            (False, "hello world [NOT_A_COLOR]\n"),
+            (True, "\033[1m\033[31mhello\033[0m \033[91mworld\033[0m [NOT_A_COLOR]\n"),
+        ]:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                whitespace_format.color_print(message, argparse.Namespace(color=color, quiet=False))
+            self.assertEqual(expected_output, output.getvalue())
+
+    def test_change_message(self):
+        """Tests Change.message() method."""
+        change = Change(ChangeType.REPLACED_NEW_LINE_MARKER, 1, "\r\n", "\n")
+        self.assertEqual(
+            change.message(check_only=False), "New line marker '\\r\\n' replaced by '\\n'."
+        )
+        self.assertEqual(
+            change.message(check_only=True),
+            "New line marker '\\r\\n' would be replaced by '\\n'.",
+        )
+        for change_type in ChangeType:
+            self.assertTrue(Change(change_type, 1).message(check_only=False))
+
     def test_escape_chars(self):
         """Tests escape_chars() function."""
         self.assertEqual(whitespace_format.escape_chars(""), "")
@@ -61,6 +93,163 @@ class TestWhitespaceFormat(unittest.TestCase):
         )
         self.assertEqual(file_content, file_content.strip() + "\r")
 
+    def test_read_file_content_binary(self):
+        """Tests read_file_content() function."""
+        self.assertIsNone(whitespace_format.read_file_content("test_data/binary-file.png", "utf-8"))
+        self.assertIsNone(
+            whitespace_format.read_file_content("test_data/binary-file.png", "latin-1")
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "utf-16.txt")
+            pathlib.Path(file_name).write_bytes("hello\n".encode("utf-16"))
+            self.assertEqual("hello\n", whitespace_format.read_file_content(file_name, "utf-16"))
+            pathlib.Path(file_name).write_bytes("\0hello\n".encode("utf-16"))
+            self.assertIsNone(whitespace_format.read_file_content(file_name, "utf-16"))
+
+    def test_encoding_allows_nul_bytes(self):
+        """Tests encoding_allows_nul_bytes() function."""
+        self.assertFalse(whitespace_format.encoding_allows_nul_bytes("utf-8"))
+        self.assertFalse(whitespace_format.encoding_allows_nul_bytes("latin-1"))
+        self.assertTrue(whitespace_format.encoding_allows_nul_bytes("utf-16"))
+        self.assertTrue(whitespace_format.encoding_allows_nul_bytes("UTF-16LE"))
+        self.assertTrue(whitespace_format.encoding_allows_nul_bytes("utf_32_be"))
+
+    def test_reformat_files__parallel__failing_file(self):
+        """Tests that parallel processing stops at a file that cannot be decoded."""
+        parsed_arguments = argparse.Namespace(
+            add_new_line_marker_at_end_of_file=False,
+            check_only=False,
+            color=False,
+            encoding="utf-8",
+            jobs=2,
+            new_line_marker="linux",
+            normalize_empty_files="ignore",
+            normalize_new_line_markers=False,
+            normalize_non_standard_whitespace="ignore",
+            normalize_whitespace_only_files="ignore",
+            quiet=False,
+            remove_new_line_marker_from_end_of_file=False,
+            remove_trailing_empty_lines=False,
+            remove_trailing_whitespace=True,
+            replace_tabs_with_spaces=-1,
+            verbose=False,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            file_names = [os.path.join(directory, f"f{i:02d}.txt") for i in range(40)]
+            for i, file_name in enumerate(file_names):
+                with open(file_name, "wb") as file:
+                    file.write(b"\xff\xfe hello \n" if i == 5 else b"hello \n")
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as context:
+                whitespace_format.reformat_files(file_names, parsed_arguments)
+
+            self.assertEqual(context.exception.code, 3)
+            self.assertIn(f"Cannot decode file '{file_names[5]}'", output.getvalue())
+            self.assertNotIn(file_names[6], output.getvalue())
+            for file_name in file_names[:5]:
+                self.assertEqual(whitespace_format.read_file_content(file_name, "utf-8"), "hello\n")
+            # Files after the failing file in the same chunk are left untouched.
+            for file_name in file_names[6 : whitespace_format.PARALLEL_CHUNK_SIZE]:
+                self.assertEqual(
+                    whitespace_format.read_file_content(file_name, "utf-8"), "hello \n"
+                )
+
+    def test_write_file(self):
+        """Tests write_file() function."""
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "file.txt")
+            whitespace_format.write_file(file_name, "hello\r\nworld\rfoo\nbar", "utf-8")
+            self.assertEqual(
+                whitespace_format.read_file_content(file_name, "utf-8"),
+                "hello\r\nworld\rfoo\nbar",
+            )
+
+    def test_non_negative_int(self):
+        """Tests non_negative_int() function."""
+        self.assertEqual(whitespace_format.non_negative_int("0"), 0)
+        self.assertEqual(whitespace_format.non_negative_int("8"), 8)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            whitespace_format.non_negative_int("-1")
+        with self.assertRaises(ValueError):
+            whitespace_format.non_negative_int("many")
+
+    def test_regular_expression(self):
+        """Tests regular_expression() function."""
+        self.assertEqual(whitespace_format.regular_expression(r"\.txt$"), re.compile(r"\.txt$"))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            whitespace_format.regular_expression("[")
+
+    def test_parse_command_line__jobs(self):
+        """Tests parsing of the --jobs command line option."""
+        for argv, expected_jobs in [
+            (["whitespace-format", "file.txt"], 1),
+            (["whitespace-format", "--jobs", "0", "file.txt"], 0),
+            (["whitespace-format", "--jobs=4", "file.txt"], 4),
+        ]:
+            with unittest.mock.patch.object(sys, "argv", argv):
+                self.assertEqual(whitespace_format.parse_command_line().jobs, expected_jobs)
+
+        with unittest.mock.patch.object(
+            sys, "argv", ["whitespace-format", "--jobs", "-1", "file.txt"]
+        ), contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                whitespace_format.parse_command_line()
+
+    def test_reformat_file_and_capture_output(self):
+        """Tests reformat_file_and_capture_output() function."""
+        parsed_arguments = argparse.Namespace(
+            add_new_line_marker_at_end_of_file=False,
+            check_only=True,
+            color=False,
+            encoding="utf-8",
+            new_line_marker="linux",
+            normalize_empty_files="ignore",
+            normalize_new_line_markers=True,
+            normalize_non_standard_whitespace="ignore",
+            normalize_whitespace_only_files="ignore",
+            quiet=False,
+            remove_new_line_marker_from_end_of_file=False,
+            remove_trailing_empty_lines=False,
+            remove_trailing_whitespace=False,
+            replace_tabs_with_spaces=-1,
+            verbose=False,
+        )
+        self.assertEqual(
+            (
+                True,
+                "✘ test_data/mac-end-of-line-markers.txt needs to be formatted\n"
+                "   ↳ line 1: New line marker '\\r' would be replaced by '\\n'.\n",
+                None,
+            ),
+            whitespace_format.reformat_file_and_capture_output(
+                "test_data/mac-end-of-line-markers.txt", parsed_arguments
+            ),
+        )
+
+        parsed_arguments.quiet = True
+        self.assertEqual(
+            (True, "", None),
+            whitespace_format.reformat_file_and_capture_output(
+                "test_data/mac-end-of-line-markers.txt", parsed_arguments
+            ),
+        )
+
+    def test_reformat_file__binary_file(self):
+        """Tests that reformat_file() function skips binary files."""
+        parsed_arguments = argparse.Namespace(
+            color=False,
+            encoding="utf-8",
+            quiet=False,
+            verbose=True,
+        )
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(
+                whitespace_format.reformat_file("test_data/binary-file.png", parsed_arguments)
+            )
+        self.assertEqual("Skipping binary file test_data/binary-file.png\n", output.getvalue())
+
     def test_find_all_files_recursively(self):
         """Tests find_all_files_recursively() function."""
         self.assertEqual(
@@ -816,6 +1005,30 @@ class TestWhitespaceFormat(unittest.TestCase):
             ),
         )
 
+    def test_format_file_content__remove_trailing_whitespace_6(self):
+        """Tests format_file_content() function."""
+        self.assertEqual(
+            (
+                "hello world\n",
+                [Change(ChangeType.REMOVED_TRAILING_WHITESPACE, 2)],
+            ),
+            whitespace_format.format_file_content(
+                "hello world\n \t ",
+                argparse.Namespace(
+                    add_new_line_marker_at_end_of_file=False,
+                    new_line_marker="auto",
+                    normalize_empty_files="ignore",
+                    normalize_new_line_markers=False,
+                    normalize_non_standard_whitespace="ignore",
+                    normalize_whitespace_only_files="ignore",
+                    remove_new_line_marker_from_end_of_file=False,
+                    remove_trailing_empty_lines=False,
+                    remove_trailing_whitespace=True,
+                    replace_tabs_with_spaces=-1,
+                ),
+            ),
+        )
+
     def test_format_file_content__remove_trailing_whitespace_and_normalize_non_standard_whitespace_1(
         self,
     ):
@@ -878,6 +1091,25 @@ class TestWhitespaceFormat(unittest.TestCase):
             ),
         )
 
+    def test_format_file_content__normalize_non_standard_whitespace__unknown_value(self):
+        """Tests format_file_content() function."""
+        with self.assertRaises(ValueError):
+            whitespace_format.format_file_content(
+                "hello world\n",
+                argparse.Namespace(
+                    add_new_line_marker_at_end_of_file=False,
+                    new_line_marker="auto",
+                    normalize_empty_files="ignore",
+                    normalize_new_line_markers=False,
+                    normalize_non_standard_whitespace="unknown",
+                    normalize_whitespace_only_files="ignore",
+                    remove_new_line_marker_from_end_of_file=False,
+                    remove_trailing_empty_lines=False,
+                    remove_trailing_whitespace=False,
+                    replace_tabs_with_spaces=-1,
+                ),
+            )
+
     def test_format_file_content__remove_trailing_whitespace_and_remove_trailing_empty_lines(self):
         """Tests format_file_content() function."""
         self.assertEqual(
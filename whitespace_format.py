@@ -14,12 +14,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import codecs
+import concurrent.futures
+import contextlib
 import dataclasses
+import functools
+import io
+import itertools
+import os
 import pathlib
 import re
+import stat
 import sys
 from enum import Enum
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 VERSION = "0.0.7"
@@ -27,6 +38,13 @@ VERSION = "0.0.7"
 # Regular expression that does NOT match any string.
 UNMATCHABLE_REGEX = "$."
 
+# Number of files sent to a worker process at once when files are processed in parallel.
+PARALLEL_CHUNK_SIZE = 16
+
+# Number of bytes at the beginning of a file that are inspected when deciding whether
+# the file is binary. For UTF-16 and UTF-32 encodings, it is the number of characters.
+BINARY_FILE_PROBE_SIZE = 4096
+
 # Whitespace characters
 CARRIAGE_RETURN = "\r"
 LINE_FEED = "\n"
@@ -44,12 +62,42 @@ WHITESPACE_CHARACTERS = {
     FORM_FEED,
 }
 
+# Regular expression that matches any character that is not a whitespace character.
+NON_WHITESPACE_REGEX = re.compile("[^" + re.escape("".join(sorted(WHITESPACE_CHARACTERS))) + "]")
+
+# Characters that form new line markers.
+NEW_LINE_CHARACTERS = CARRIAGE_RETURN + LINE_FEED
+
+# Whitespace characters that can appear inside a line.
+HORIZONTAL_WHITESPACE_CHARACTERS = SPACE + TAB + VERTICAL_TAB + FORM_FEED
+
+# Regular expression that matches a line, i.e., a possibly empty sequence of characters
+# other than new line characters followed by a new line marker or by the end of the text.
+LINE_REGEX = re.compile(r"([^\r\n]*)(\r\n|\r|\n|)")
+
+# Regular expression that matches whitespace at the end of a line.
+TRAILING_WHITESPACE_REGEX = re.compile(r"[ \t\v\f](?:[\r\n]|\Z)")
+
+# Regular expression that matches the end of a text whose last line is non-empty and
+# is followed by at most one new line marker.
+NON_EMPTY_LAST_LINE_REGEX = re.compile(r"[^\r\n](?:\r\n|\r|\n)?\Z")
+
+# Regular expression that matches a tab or a non-standard whitespace character.
+TAB_OR_NON_STANDARD_WHITESPACE_REGEX = re.compile(r"[\t\v\f]")
+
 NEW_LINE_MARKERS = {
     "windows": "\r\n",
     "linux": "\n",
     "mac": "\r",
 }
 
+# Regular expressions that match any new line marker other than the given one.
+OTHER_NEW_LINE_MARKERS_REGEXES = {
+    "\r\n": re.compile(r"\r(?!\n)|(?<!\r)\n"),
+    "\n": re.compile(r"\r"),
+    "\r": re.compile(r"\n"),
+}
+
 COLORS = {
     "RESET_ALL": "\033[0m",
     "BOLD": "\033[1m",
@@ -76,6 +124,9 @@ COLORS = {
     "WHITE": "\033[97m",
 }
 
+# Regular expression that matches color tags such as [BOLD] or [RESET_ALL] in messages.
+COLOR_TAG_REGEX = re.compile(r"\[(" + "|".join(COLORS) + r")\]")
+
 ESCAPE_TRANSLATION_TABLE = str.maketrans(
     {
         CARRIAGE_RETURN: "\\r",
@@ -127,6 +178,41 @@ class ChangeType(Enum):
     REMOVED_NONSTANDARD_WHITESPACE = 12
 
 
+# Templates of messages describing each type of change.
+CHANGE_MESSAGE_TEMPLATES = {
+    ChangeType.ADDED_NEW_LINE_MARKER_TO_END_OF_FILE: (
+        "New line marker{check_only_word}added to the end of the file."
+    ),
+    ChangeType.REMOVED_NEW_LINE_MARKER_FROM_END_OF_FILE: (
+        "New line marker{check_only_word}removed from the end of the file."
+    ),
+    ChangeType.REPLACED_NEW_LINE_MARKER: (
+        "New line marker '{changed_from}'{check_only_word}replaced by '{changed_to}'."
+    ),
+    ChangeType.REMOVED_TRAILING_WHITESPACE: "Trailing whitespace{check_only_word}removed.",
+    ChangeType.REMOVED_EMPTY_LINES: (
+        "Empty line(s) at the end of the file{check_only_word}removed."
+    ),
+    ChangeType.REPLACED_EMPTY_FILE_WITH_ONE_LINE: (
+        "Empty file{check_only_word}replaced with a single empty line."
+    ),
+    ChangeType.REPLACED_WHITESPACE_ONLY_FILE_WITH_EMPTY_FILE: (
+        "File{check_only_word}replaced with an empty file."
+    ),
+    ChangeType.REPLACED_WHITESPACE_ONLY_FILE_WITH_ONE_LINE: (
+        "File{check_only_word}replaced with a single empty line."
+    ),
+    ChangeType.REPLACED_TAB_WITH_SPACES: "Tab{check_only_word}replaced with spaces.",
+    ChangeType.REMOVED_TAB: "Tab{check_only_word}removed.",
+    ChangeType.REPLACED_NONSTANDARD_WHITESPACE: (
+        "Non-standard whitespace character '{changed_from}'{check_only_word}replaced by a space."
+    ),
+    ChangeType.REMOVED_NONSTANDARD_WHITESPACE: (
+        "Non-standard whitespace character '{changed_from}'{check_only_word}removed."
+    ),
+}
+
+
 @dataclasses.dataclass
 class Change:
     """Description of a change of the content of a file."""
@@ -138,56 +224,22 @@ class Change:
 
     def message(self, check_only: bool) -> str:
         """Returns a message describing the change."""
-        check_only_word = " would be " if check_only else " "
-
-        if self.change_type == ChangeType.ADDED_NEW_LINE_MARKER_TO_END_OF_FILE:
-            return f"New line marker{check_only_word}added to the end of the file."
-
-        if self.change_type == ChangeType.REMOVED_NEW_LINE_MARKER_FROM_END_OF_FILE:
-            return f"New line marker{check_only_word}removed from the end of the file."
-
-        if self.change_type == ChangeType.REPLACED_NEW_LINE_MARKER:
-            return (
-                f"New line marker '{escape_chars(self.changed_from)}'"
-                f"{check_only_word}replaced by '{escape_chars(self.changed_to)}'."
-            )
-
-        if self.change_type == ChangeType.REMOVED_TRAILING_WHITESPACE:
-            return f"Trailing whitespace{check_only_word}removed."
-
-        if self.change_type == ChangeType.REMOVED_EMPTY_LINES:
-            return f"Empty line(s) at the end of the file{check_only_word}removed."
-
-        if self.change_type == ChangeType.REPLACED_EMPTY_FILE_WITH_ONE_LINE:
-            return f"Empty file{check_only_word}replaced with a single empty line."
-
-        if self.change_type == ChangeType.REPLACED_WHITESPACE_ONLY_FILE_WITH_EMPTY_FILE:
-            return f"File{check_only_word}replaced with an empty file."
-
-        if self.change_type == ChangeType.REPLACED_WHITESPACE_ONLY_FILE_WITH_ONE_LINE:
-            return f"File{check_only_word}replaced with a single empty line."
-
-        if self.change_type == ChangeType.REPLACED_TAB_WITH_SPACES:
-            return f"Tab{check_only_word}replaced with spaces."
-
-        if self.change_type == ChangeType.REMOVED_TAB:
-            return f"Tab{check_only_word}removed."
-
-        if self.change_type == ChangeType.REPLACED_NONSTANDARD_WHITESPACE:
-            return (
-                f"Non-standard whitespace character '{escape_chars(self.changed_from)}'"
-                f"{check_only_word}replaced by a space."
-            )
-
-        if self.change_type == ChangeType.REMOVED_NONSTANDARD_WHITESPACE:
-            return f"Non-standard whitespace character '{escape_chars(self.changed_from)}'{check_only_word}removed."
-
-        raise ValueError(f"Unknown change type: {self.change_type}")
+        template = CHANGE_MESSAGE_TEMPLATES.get(self.change_type)
+        if template is None:
+            raise ValueError(f"Unknown change type: {self.change_type}")
+
+        return template.format(
+            check_only_word=" would be " if check_only else " ",
+            changed_from=escape_chars(self.changed_from),
+            changed_to=escape_chars(self.changed_to),
+        )
 
     def color_print(self, parsed_arguments: argparse.Namespace) -> None:
-        """Prints a message in color."""
+        """Prints an indented message in color."""
+        if parsed_arguments.quiet:
+            return
         color_print(
-            f"[BOLD][BLUE]↳ line {self.line_number}: "
+            f"   [BOLD][BLUE]↳ line {self.line_number}: "
             f"[WHITE]{self.message(parsed_arguments.check_only)}[RESET_ALL]",
             parsed_arguments,
         )
@@ -197,16 +249,20 @@ def color_print(message: str, parsed_arguments: argparse.Namespace):
     """Outputs a colored message."""
     if parsed_arguments.quiet:
         return
-    for color, code in COLORS.items():
-        if parsed_arguments.color:
-            message = message.replace(f"[{color}]", code)
-        else:
-            message = message.replace(f"[{color}]", "")
+    if parsed_arguments.color:
+        message = COLOR_TAG_REGEX.sub(lambda match: COLORS[match.group(1)], message)
+    else:
+        message = COLOR_TAG_REGEX.sub("", message)
     print(message)
 
 
+@functools.lru_cache(maxsize=None)
 def escape_chars(text: str) -> str:
-    """Escapes special characters in a string."""
+    """Escapes special characters in a string.
+
+    The function is called only with a handful of distinct new line markers and whitespace
+    characters, so the results are cached.
+    """
     return text.translate(ESCAPE_TRANSLATION_TABLE)
 
 
@@ -225,36 +281,61 @@ def die(error_code: int, message: str = ""):
     sys.exit(error_code)
 
 
-def read_file_content(file_name: str, encoding: str) -> str:
+def encoding_allows_nul_bytes(encoding: str) -> bool:
+    """Determines if NUL bytes can appear in ordinary text in the given encoding.
+
+    This is the case for the UTF-16 and UTF-32 encodings.
+    """
+    return codecs.lookup(encoding).name.startswith(("utf-16", "utf-32"))
+
+
+def read_file_content(file_name: str, encoding: str) -> Optional[str]:
     """Reads content of a file.
 
     New line markers are preserved in their original form.
+
+    Returns:
+        Content of the file, or None if the file is a binary file. A file is considered
+        binary if there is a NUL byte among its first few thousand bytes. For encodings
+        in which NUL bytes are part of ordinary characters, a file is considered binary
+        if there is a NUL character among its first few thousand characters.
     """
     try:
-        with open(file_name, "r", encoding=encoding, newline="") as file:
-            return file.read()
+        data = pathlib.Path(file_name).read_bytes()
     except IOError as exception:
         die(2, f"Cannot read file '{file_name}': {exception}")
+        return None
+
+    # Binary files are skipped without decoding them.
+    if not encoding_allows_nul_bytes(encoding) and b"\0" in data[:BINARY_FILE_PROBE_SIZE]:
+        return None
+
+    try:
+        file_content = data.decode(encoding)
     except UnicodeError as exception:
         die(3, f"Cannot decode file '{file_name}': {exception}")
-    return ""
+        return None
+
+    # In UTF-16 and UTF-32 encodings, binary files are detected on the decoded characters.
+    if encoding_allows_nul_bytes(encoding) and "\0" in file_content[:BINARY_FILE_PROBE_SIZE]:
+        return None
+    return file_content
 
 
 def write_file(file_name: str, file_content: str, encoding: str):
-    """Writes data to a file."""
+    """Writes data to a file.
+
+    New line markers are written in their original form.
+    """
     try:
-        with open(file_name, "w", encoding=encoding) as file:
-            file.write(file_content)
+        pathlib.Path(file_name).write_bytes(file_content.encode(encoding))
     except IOError as exception:
         die(4, f"Cannot write to file '{file_name}': {exception}")
 
 
 def is_whitespace_only(text: str) -> bool:
     """Determines if a string consists of only whitespace characters."""
-    for char in text:
-        if char not in WHITESPACE_CHARACTERS:
-            return False
-    return True
+    return NON_WHITESPACE_REGEX.search(text) is None
 
 
 def find_most_common_new_line_marker(text: str) -> str:
@@ -269,21 +350,14 @@ def find_most_common_new_line_marker(text: str) -> str:
     Returns:
         Either '\n', or '\r\n' or '\r'.
     """
-    linux_count = 0
-    mac_count = 0
-    windows_count = 0
-    i = 0
-
-    while i < len(text):
-        if text[i] == CARRIAGE_RETURN:
-            if i < len(text) - 1 and text[i + 1] == LINE_FEED:
-                windows_count += 1
-                i += 1
-            else:
-                mac_count += 1
-        elif text[i] == LINE_FEED:
-            linux_count += 1
-        i += 1
+    # Without any carriage return, Linux wins or there are no new line markers at all.
+    if CARRIAGE_RETURN not in text:
+        return "\n"
+
+    # Each Windows new line marker '\r\n' contains one Mac '\r' and one Linux '\n' marker.
+    windows_count = text.count("\r\n")
+    linux_count = text.count(LINE_FEED) - windows_count
+    mac_count = text.count(CARRIAGE_RETURN) - windows_count
 
     if mac_count > windows_count and mac_count > linux_count:
         return "\r"
@@ -294,6 +368,210 @@ def find_most_common_new_line_marker(text: str) -> str:
     return "\n"
 
 
+@dataclasses.dataclass
+class LineFormattingSteps:
+    """Formatting steps applied to each line of a file.
+
+    A step is enabled only if it is requested and it can change the file. Values derived
+    from the command line arguments are computed once per file, so the per-line helpers
+    do not read the parsed arguments.
+    """
+
+    # Tabs and/or non-standard whitespace characters are replaced or removed.
+    normalize_whitespace_characters: bool
+
+    # Tabs are the only characters to replace or remove.
+    normalize_tabs_only: bool
+
+    # String that replaces a tab.
+    tab_replacement: str
+
+    # Translation table that maps tabs and non-standard whitespace characters
+    # that are replaced or removed to their replacements.
+    whitespace_replacements: Dict[int, str]
+
+    # Whitespace at the end of lines is removed.
+    remove_trailing_whitespace: bool
+
+    # New line markers other than the output new line marker are replaced.
+    normalize_new_line_markers: bool
+
+
+def find_line_formatting_steps(
+    file_content: str, parsed_arguments: argparse.Namespace, output_new_line_marker: str
+) -> LineFormattingSteps:
+    """Determines which formatting steps can change the lines of a file.
+
+    Args:
+        file_content: Content of the file.
+        parsed_arguments: Parsed command line arguments.
+        output_new_line_marker: New line marker used in the formatted file.
+
+    Returns:
+        Formatting steps that need to be applied to the lines of the file.
+    """
+    # Number of spaces that replace a tab. Negative value means that tabs are left as is.
+    replace_tabs_with_spaces: int = parsed_arguments.replace_tabs_with_spaces
+
+    # Non-standard whitespace characters are left as is if they are ignored or missing.
+    keep_non_standard_whitespace = (
+        parsed_arguments.normalize_non_standard_whitespace == "ignore"
+        or (VERTICAL_TAB not in file_content and FORM_FEED not in file_content)
+    )
+
+    # String that replaces a tab. It is built once per file.
+    tab_replacement = SPACE * replace_tabs_with_spaces
+
+    whitespace_replacements: Dict[int, str] = {}
+    if replace_tabs_with_spaces >= 0:
+        whitespace_replacements[ord(TAB)] = tab_replacement
+    if parsed_arguments.normalize_non_standard_whitespace != "ignore":
+        non_standard_whitespace_replacement = (
+            SPACE if parsed_arguments.normalize_non_standard_whitespace == "replace" else ""
+        )
+        whitespace_replacements[ord(VERTICAL_TAB)] = non_standard_whitespace_replacement
+        whitespace_replacements[ord(FORM_FEED)] = non_standard_whitespace_replacement
+
+    return LineFormattingSteps(
+        # Tabs and non-standard whitespace characters need to be inspected
+        # only if they are replaced or removed and the file contains any of them.
+        normalize_whitespace_characters=(
+            (replace_tabs_with_spaces >= 0 and TAB in file_content)
+            or not keep_non_standard_whitespace
+        ),
+        # When tabs are the only characters to replace or remove, each line is processed
+        # with str.replace instead of a substitution with a callback per character.
+        normalize_tabs_only=replace_tabs_with_spaces >= 0 and keep_non_standard_whitespace,
+        tab_replacement=tab_replacement,
+        whitespace_replacements=whitespace_replacements,
+        # Lines need to be stripped only if some line ends with whitespace. Replacing or removing
+        # tabs and non-standard whitespace characters cannot create new trailing whitespace.
+        remove_trailing_whitespace=(
+            parsed_arguments.remove_trailing_whitespace
+            and TRAILING_WHITESPACE_REGEX.search(file_content) is not None
+        ),
+        # New line markers need to be inspected only if some of them differ from the output one.
+        normalize_new_line_markers=(
+            parsed_arguments.normalize_new_line_markers
+            and OTHER_NEW_LINE_MARKERS_REGEXES[output_new_line_marker].search(file_content)
+            is not None
+        ),
+    )
+
+
+def is_formatted_already(
+    file_content: str, parsed_arguments: argparse.Namespace, steps: LineFormattingSteps
+) -> bool:
+    """Determines if a non-empty file needs no changes inside its lines nor at its end.
+
+    The end of the file is inspected only on its last few characters.
+    """
+    if (
+        steps.normalize_whitespace_characters
+        or steps.remove_trailing_whitespace
+        or steps.normalize_new_line_markers
+    ):
+        return False
+
+    # The last line must be non-empty and followed by at most one new line marker.
+    if not NON_EMPTY_LAST_LINE_REGEX.search(file_content[-3:]):
+        return False
+
+    ends_with_new_line_marker = file_content[-1] in NEW_LINE_CHARACTERS
+    if parsed_arguments.add_new_line_marker_at_end_of_file and not ends_with_new_line_marker:
+        return False
+    if parsed_arguments.remove_new_line_marker_from_end_of_file and ends_with_new_line_marker:
+        return False
+    return True
+
+
+def normalize_whitespace_characters_in_line(
+    line: str, line_number: int, steps: LineFormattingSteps, changes: List[Change]
+) -> str:
+    """Replaces or removes tabs and non-standard whitespace characters in a line.
+
+    Each replaced or removed character is recorded in the list of changes.
+
+    Args:
+        line: A line without a new line marker.
+        line_number: Number of the line.
+        steps: Formatting steps of the file, including the replacements of the characters.
+        changes: List of changes to which the changes are appended.
+
+    Returns:
+        The line with tabs and non-standard whitespace characters replaced or removed.
+    """
+    whitespace_replacements = steps.whitespace_replacements
+
+    def normalize_whitespace_character(match: re.Match) -> str:
+        """Replaces or removes a single tab or non-standard whitespace character."""
+        character = match.group()
+        replacement = whitespace_replacements.get(ord(character))
+        if replacement is None:
+            return character
+        if character == TAB:
+            if replacement:
+                changes.append(Change(ChangeType.REPLACED_TAB_WITH_SPACES, line_number))
+            else:
+                changes.append(Change(ChangeType.REMOVED_TAB, line_number))
+        elif replacement:
+            changes.append(
+                Change(ChangeType.REPLACED_NONSTANDARD_WHITESPACE, line_number, character, SPACE)
+            )
+        else:
+            changes.append(
+                Change(ChangeType.REMOVED_NONSTANDARD_WHITESPACE, line_number, character, "")
+            )
+        return replacement
+
+    return TAB_OR_NON_STANDARD_WHITESPACE_REGEX.sub(normalize_whitespace_character, line)
+
+
+def replace_tabs_in_line(
+    line: str, line_number: int, tab_replacement: str, changes: List[Change]
+) -> str:
+    """Replaces or removes tabs in a line.
+
+    Each replaced or removed tab is recorded in the list of changes. The result is the same
+    as the one of normalize_whitespace_characters_in_line() when tabs are the only characters
+    to normalize; the two functions must be kept in sync.
+
+    Args:
+        line: A line without a new line marker.
+        line_number: Number of the line.
+        tab_replacement: String that replaces a tab. An empty string removes tabs.
+        changes: List of changes to which the changes are appended.
+
+    Returns:
+        The line with tabs replaced or removed.
+    """
+    tab_count = line.count(TAB)
+    if not tab_count:
+        return line
+
+    change_type = ChangeType.REPLACED_TAB_WITH_SPACES if tab_replacement else ChangeType.REMOVED_TAB
+    for _ in range(tab_count):
+        changes.append(Change(change_type, line_number))
+    return line.replace(TAB, tab_replacement)
+
+
+def remove_trailing_whitespace_from_line(line: str, line_number: int, changes: List[Change]) -> str:
+    """Removes whitespace at the end of a line and records the change.
+
+    Args:
+        line: A line without a new line marker.
+        line_number: Number of the line.
+        changes: List of changes to which the change is appended.
+
+    Returns:
+        The line without trailing whitespace.
+    """
+    stripped_line = line.rstrip(HORIZONTAL_WHITESPACE_CHARACTERS)
+    if len(stripped_line) < len(line):
+        changes.append(Change(ChangeType.REMOVED_TRAILING_WHITESPACE, line_number))
+    return stripped_line
+
+
 def format_file_content(
     file_content: str,
     parsed_arguments: argparse.Namespace,
@@ -309,10 +587,15 @@ def format_file_content(
     Returns:
         A pair consisting of the formatted file content and a list of changes.
     """
-    output_new_line_marker = NEW_LINE_MARKERS.get(
-        parsed_arguments.new_line_marker,
-        find_most_common_new_line_marker(file_content),
-    )
+    # Scan the file for the most common new line marker only if the new line marker
+    # is not explicitly specified.
+    output_new_line_marker = NEW_LINE_MARKERS.get(parsed_arguments.new_line_marker)
+    if output_new_line_marker is None:
+        output_new_line_marker = find_most_common_new_line_marker(file_content)
+
+    # Validate the mode once per file rather than once per non-standard whitespace character.
+    if parsed_arguments.normalize_non_standard_whitespace not in ["ignore", "replace", "remove"]:
+        raise ValueError("Unknown value of normalize_non_standard_whitespace")
 
     # Handle empty file:
     if not file_content:
@@ -334,8 +617,12 @@ def format_file_content(
         if parsed_arguments.normalize_whitespace_only_files == "ignore":
             return file_content, []
 
-    # Index into the input buffer.
-    i = 0
+    # Formatting steps that can change the lines of the file.
+    steps = find_line_formatting_steps(file_content, parsed_arguments, output_new_line_marker)
+
+    # A file that needs no changes inside its lines nor at its end is returned as is.
+    if is_formatted_already(file_content, parsed_arguments, steps):
+        return file_content, []
 
     # List of changes
     changes: List[Change] = []
@@ -347,9 +634,6 @@ def format_file_content(
     # including the last end of line marker.
     last_end_of_line_including_eol_marker = 0
 
-    # Position one character past the last non-whitespace character in the output buffer.
-    last_non_whitespace = 0
-
     # Position one character past the end of last non-empty line in the output buffer
     # excluding the last end of line marker.
     last_end_of_non_empty_line_excluding_eol_marker = 0
@@ -361,160 +645,90 @@ def format_file_content(
     # Line number of the last non-empty line.
     last_non_empty_line_number = 0
 
-    # Formatted output
-    output = ""
-
-    while i < len(file_content):
-        if file_content[i] in [CARRIAGE_RETURN, LINE_FEED]:
-            # Parse the new line marker
-            new_line_marker = ""
-            if file_content[i] == LINE_FEED:
-                new_line_marker = LINE_FEED
-            elif i < len(file_content) - 1 and file_content[i + 1] == LINE_FEED:
-                new_line_marker = "\r\n"
-                # Windows new line marker consists of two characters.
-                # Skip the extra character.
-                i += 1
-            else:
-                new_line_marker = CARRIAGE_RETURN
-
-            # Remove trailing whitespace
-            if parsed_arguments.remove_trailing_whitespace and max(
-                last_non_whitespace, last_end_of_line_including_eol_marker
-            ) < len(output):
-                changes.append(
-                    Change(
-                        ChangeType.REMOVED_TRAILING_WHITESPACE,
-                        line_number,
-                    )
-                )
-                output = output[
-                    : max(
-                        last_non_whitespace,
-                        last_end_of_line_including_eol_marker,
-                    )
-                ]
-
-            # Determine if the last line is empty
-            is_empty_line: bool = last_end_of_line_including_eol_marker == len(output)
-
-            # Position one character past the end of last line in the output buffer
-            # excluding the last end of line marker.
-            last_end_of_line_excluding_eol_marker = len(output)
-
-            # Add new line marker
-            if (
-                parsed_arguments.normalize_new_line_markers
-                and output_new_line_marker != new_line_marker
-            ):
-                changes.append(
-                    Change(
-                        ChangeType.REPLACED_NEW_LINE_MARKER,
-                        line_number,
-                        new_line_marker,
-                        output_new_line_marker,
-                    )
-                )
-                output += output_new_line_marker
-            else:
-                output += new_line_marker
-
-            last_end_of_line_including_eol_marker = len(output)
-
-            # Update position of last non-empty line.
-            if not is_empty_line:
-                last_end_of_non_empty_line_excluding_eol_marker = (
-                    last_end_of_line_excluding_eol_marker
-                )
-                last_end_of_non_empty_line_including_eol_marker = (
-                    last_end_of_line_including_eol_marker
-                )
-                last_non_empty_line_number = line_number
-
-            line_number += 1
+    # Formatted output, as a list of lines and new line markers, and its length.
+    output_parts: List[str] = []
+    output_length = 0
 
-        elif file_content[i] == SPACE:
-            output += file_content[i]
+    # The last match is always a line without a new line marker; it can be empty.
+    for match in LINE_REGEX.finditer(file_content):
+        line, new_line_marker = match.groups()
 
-        elif file_content[i] == TAB:
-            if parsed_arguments.replace_tabs_with_spaces < 0:
-                output += file_content[i]
-            elif parsed_arguments.replace_tabs_with_spaces > 0:
-                changes.append(Change(ChangeType.REPLACED_TAB_WITH_SPACES, line_number))
-                output += SPACE * parsed_arguments.replace_tabs_with_spaces
+        if steps.normalize_whitespace_characters:
+            if steps.normalize_tabs_only:
+                line = replace_tabs_in_line(line, line_number, steps.tab_replacement, changes)
             else:
-                # Remove the tab character.
-                changes.append(Change(ChangeType.REMOVED_TAB, line_number))
-
-        elif file_content[i] in [VERTICAL_TAB, FORM_FEED]:
-            if parsed_arguments.normalize_non_standard_whitespace == "ignore":
-                output += file_content[i]
-            elif parsed_arguments.normalize_non_standard_whitespace == "replace":
-                output += SPACE
-                changes.append(
-                    Change(
-                        ChangeType.REPLACED_NONSTANDARD_WHITESPACE,
-                        line_number,
-                        file_content[i],
-                        SPACE,
-                    )
+                line = normalize_whitespace_characters_in_line(line, line_number, steps, changes)
+
+        if steps.remove_trailing_whitespace:
+            line = remove_trailing_whitespace_from_line(line, line_number, changes)
+
+        output_parts.append(line)
+        output_length += len(line)
+
+        # The last line has no new line marker.
+        if not new_line_marker:
+            break
+
+        # Replace new line marker
+        if steps.normalize_new_line_markers and output_new_line_marker != new_line_marker:
+            changes.append(
+                Change(
+                    ChangeType.REPLACED_NEW_LINE_MARKER,
+                    line_number,
+                    new_line_marker,
+                    output_new_line_marker,
                 )
-            elif parsed_arguments.normalize_non_standard_whitespace == "remove":
-                changes.append(
-                    Change(
-                        ChangeType.REMOVED_NONSTANDARD_WHITESPACE, line_number, file_content[i], ""
-                    )
-                )
-            else:
-                raise ValueError("Unknown value of normalize_non_standard_whitespace")
-        else:
-            output += file_content[i]
-            last_non_whitespace = len(output)
+            )
+            new_line_marker = output_new_line_marker
 
-        # Move to the next character
-        i += 1
+        # Update position of last non-empty line.
+        if line:
+            last_end_of_non_empty_line_excluding_eol_marker = output_length
+            last_end_of_non_empty_line_including_eol_marker = output_length + len(new_line_marker)
+            last_non_empty_line_number = line_number
 
-    # Remove trailing whitespace from the last line.
-    if (
-        parsed_arguments.remove_trailing_whitespace
-        and last_end_of_line_including_eol_marker < len(output)
-        and last_non_whitespace < len(output)
-    ):
-        changes.append(Change(ChangeType.REMOVED_TRAILING_WHITESPACE, line_number))
-        output = output[:last_non_whitespace]
+        output_parts.append(new_line_marker)
+        output_length += len(new_line_marker)
+        last_end_of_line_including_eol_marker = output_length
+
+        line_number += 1
 
     # Remove trailing empty lines.
     if (
         parsed_arguments.remove_trailing_empty_lines
-        and last_end_of_line_including_eol_marker == len(output)
-        and last_end_of_non_empty_line_including_eol_marker < len(output)
+        and last_end_of_non_empty_line_including_eol_marker
+        < last_end_of_line_including_eol_marker
+        == output_length
     ):
         line_number = last_non_empty_line_number + 1
         last_end_of_line_including_eol_marker = last_end_of_non_empty_line_including_eol_marker
         changes.append(Change(ChangeType.REMOVED_EMPTY_LINES, line_number))
-        output = output[:last_end_of_non_empty_line_including_eol_marker]
+        output_length = last_end_of_non_empty_line_including_eol_marker
 
     # Add new line marker at the end of the file
     if (
         parsed_arguments.add_new_line_marker_at_end_of_file
-        and last_end_of_line_including_eol_marker < len(output)
+        and last_end_of_line_including_eol_marker < output_length
     ):
         changes.append(Change(ChangeType.ADDED_NEW_LINE_MARKER_TO_END_OF_FILE, line_number))
-        output += output_new_line_marker
-        last_end_of_line_including_eol_marker = len(output)
+        output_parts.append(output_new_line_marker)
+        output_length += len(output_new_line_marker)
+        last_end_of_line_including_eol_marker = output_length
         line_number += 1
 
     # Remove new line marker(s) from the end of the file
     if (
         parsed_arguments.remove_new_line_marker_from_end_of_file
-        and last_end_of_line_including_eol_marker == len(output)
+        and last_end_of_line_including_eol_marker == output_length
         and line_number >= 2
     ):
         line_number = last_non_empty_line_number
         changes.append(Change(ChangeType.REMOVED_NEW_LINE_MARKER_FROM_END_OF_FILE, line_number))
-        output = output[:last_end_of_non_empty_line_excluding_eol_marker]
+        output_length = last_end_of_non_empty_line_excluding_eol_marker
 
-    return output, changes
+    # Empty lines and new line markers removed from the end of the file are cut off here.
+    # Slicing a string to its full length returns the string itself without copying it.
+    return "".join(output_parts)[:output_length], changes
 
 
 def reformat_file(file_name: str, parsed_arguments: argparse.Namespace) -> bool:
@@ -528,6 +742,12 @@ def reformat_file(file_name: str, parsed_arguments: argparse.Namespace) -> bool:
          True if the file was changed, False otherwise.
     """
     file_content = read_file_content(file_name, parsed_arguments.encoding)
+    if file_content is None:
+        if parsed_arguments.verbose:
+            color_print(
+                f"[WHITE]Skipping binary file [BOLD]{file_name}[RESET_ALL]", parsed_arguments
+            )
+        return False
     formatted_file_content, file_changes = format_file_content(file_content, parsed_arguments)
     if parsed_arguments.verbose:
         color_print(f"[WHITE]Processing file [BOLD]{file_name}[RESET_ALL]...", parsed_arguments)
@@ -539,7 +759,6 @@ def reformat_file(file_name: str, parsed_arguments: argparse.Namespace) -> bool:
                 parsed_arguments,
             )
             for line_change in file_changes:
-                print("   ", end="")
                 line_change.color_print(parsed_arguments)
         else:
             if parsed_arguments.verbose:
@@ -552,7 +771,6 @@ def reformat_file(file_name: str, parsed_arguments: argparse.Namespace) -> bool:
         if file_changes:
             color_print(f"[WHITE]Reformatted [BOLD]{file_name}[RESET_ALL]", parsed_arguments)
             for line_change in file_changes:
-                print("   ", end="")
                 line_change.color_print(parsed_arguments)
             write_file(
                 file_name,
@@ -566,14 +784,97 @@ def reformat_file(file_name: str, parsed_arguments: argparse.Namespace) -> bool:
     return bool(file_changes)
 
 
+def reformat_file_and_capture_output(
+    file_name: str, parsed_arguments: argparse.Namespace
+) -> Tuple[bool, str, Optional[int]]:
+    """Reformats a file and captures the messages instead of printing them.
+
+    The captured messages are written to the standard output at once. When files are
+    processed in parallel, this also ensures that messages about different files are
+    not interleaved.
+
+    Args:
+        file_name: Name of the file to reformat.
+        parsed_arguments: Parsed command line arguments.
+
+    Returns:
+        A triple consisting of a flag indicating if the file was changed, the captured
+        messages, and an exit code if the processing of the file failed, or None otherwise.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            is_changed = reformat_file(file_name, parsed_arguments)
+        except SystemExit as exception:
+            # die() always exits with an integer code.
+            exit_code = exception.code if isinstance(exception.code, int) else 1
+            return False, output.getvalue(), exit_code
+    return is_changed, output.getvalue(), None
+
+
+def reformat_chunk_and_capture_output(
+    file_names: List[str], parsed_arguments: argparse.Namespace
+) -> List[Tuple[bool, str, Optional[int]]]:
+    """Reformats a chunk of files in a worker process and captures the messages.
+
+    Files are processed in order. Like in sequential processing, the processing stops
+    at the first file that fails, and the remaining files of the chunk are left untouched.
+
+    Args:
+        file_names: Names of the files to reformat.
+        parsed_arguments: Parsed command line arguments.
+
+    Returns:
+        Results of reformat_file_and_capture_output() for the processed files.
+    """
+    results = []
+    for file_name in file_names:
+        result = reformat_file_and_capture_output(file_name, parsed_arguments)
+        results.append(result)
+        if result[2] is not None:
+            break
+    return results
+
+
 def reformat_files(file_names: List[str], parsed_arguments: argparse.Namespace):
     """Reformats multiple files."""
     color_print(f"Processing {len(file_names)} file(s)...", parsed_arguments)
     num_changed_files = 0
-    for file_name in file_names:
-        is_formatted = reformat_file(file_name, parsed_arguments)
-        if is_formatted:
-            num_changed_files += 1
+    with contextlib.ExitStack() as exit_stack:
+        results: Iterator[Tuple[bool, str, Optional[int]]]
+        futures: List[concurrent.futures.Future] = []
+
+        # Files that fit into a single chunk would be processed by a single worker anyway.
+        if parsed_arguments.jobs == 1 or len(file_names) <= PARALLEL_CHUNK_SIZE:
+            results = map(
+                reformat_file_and_capture_output, file_names, itertools.repeat(parsed_arguments)
+            )
+        else:
+            executor = exit_stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(max_workers=parsed_arguments.jobs or None)
+            )
+            futures = [
+                executor.submit(
+                    reformat_chunk_and_capture_output,
+                    file_names[start : start + PARALLEL_CHUNK_SIZE],
+                    parsed_arguments,
+                )
+                for start in range(0, len(file_names), PARALLEL_CHUNK_SIZE)
+            ]
+            results = itertools.chain.from_iterable(future.result() for future in futures)
+
+        # Results are returned in the same order as the files.
+        for is_formatted, output, exit_code in results:
+            sys.stdout.write(output)
+            if exit_code is not None:
+                # Chunks that have not been handed over to the worker processes yet are
+                # cancelled, so that their files are left untouched. Chunks that are already
+                # running cannot be cancelled; their files may still be written.
+                for future in futures:
+                    future.cancel()
+                die(exit_code)
+            if is_formatted:
+                num_changed_files += 1
 
     if parsed_arguments.check_only:
         message = ""
@@ -596,21 +897,51 @@ def reformat_files(file_names: List[str], parsed_arguments: argparse.Namespace):
 
 
 def find_all_files_recursively(file_name: str, follow_symlinks: bool) -> List[str]:
-    """Finds files in directories recursively."""
-    if (not follow_symlinks) and pathlib.Path(file_name).is_symlink():
+    """Finds files in directories recursively.
+
+    Directories are read with os.scandir(), which provides the type of each entry
+    without an additional stat() system call per entry.
+    """
+    if (not follow_symlinks) and os.path.islink(file_name):
         return []
 
-    if pathlib.Path(file_name).is_file():
+    try:
+        mode = os.stat(file_name).st_mode
+    except OSError:
+        return []
+
+    if stat.S_ISREG(mode):
         return [file_name]
 
-    if pathlib.Path(file_name).is_dir():
-        return [
-            expanded_file_name
-            for inner_file in sorted(pathlib.Path(file_name).iterdir())
-            for expanded_file_name in find_all_files_recursively(str(inner_file), follow_symlinks)
-        ]
+    if not stat.S_ISDIR(mode):
+        return []
+
+    file_names: List[str] = []
+
+    # Directory entries that remain to be visited, together with their paths.
+    # Entries of each directory are pushed in reverse order, so that they are popped
+    # in sorted order.
+    stack: List[Tuple[str, os.DirEntry]] = []
+
+    def push_directory_entries(directory: str):
+        """Pushes entries of a directory onto the stack."""
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name, reverse=True):
+                # Same path as pathlib, which omits the leading './'.
+                entry_path = entry.name if directory == "." else os.path.join(directory, entry.name)
+                stack.append((entry_path, entry))
 
-    return []
+    push_directory_entries(str(pathlib.Path(file_name)))
+    while stack:
+        entry_path, entry = stack.pop()
+        if (not follow_symlinks) and entry.is_symlink():
+            continue
+        if entry.is_file():
+            file_names.append(entry_path)
+        elif entry.is_dir():
+            push_directory_entries(entry_path)
+
+    return file_names
 
 
 def find_files_to_process(file_names: List[str], parsed_arguments: argparse.Namespace) -> List[str]:
@@ -619,15 +950,45 @@ def find_files_to_process(file_names: List[str], parsed_arguments: argparse.Name
     The function excludes files that match the regular expression specified
     by the --exclude command line option.
     """
-    return [
+    # The regular expression is compiled by the command line parser.
+    # Compiling an already compiled regular expression returns it unchanged.
+    exclude_regex = re.compile(parsed_arguments.exclude)
+    expanded_file_names = [
         expanded_file_name
         for file_name in file_names
         for expanded_file_name in find_all_files_recursively(
             file_name, parsed_arguments.follow_symlinks
         )
-        if not re.search(parsed_arguments.exclude, expanded_file_name)
     ]
 
+    # Without --exclude, no file needs to be matched against the regular expression.
+    if exclude_regex.pattern == UNMATCHABLE_REGEX:
+        return expanded_file_names
+
+    return [
+        expanded_file_name
+        for expanded_file_name in expanded_file_names
+        if not exclude_regex.search(expanded_file_name)
+    ]
+
+
+def non_negative_int(value: str) -> int:
+    """Converts a command line argument to a non-negative integer."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
+
+
+def regular_expression(value: str) -> re.Pattern:
+    """Compiles a command line argument to a regular expression."""
+    try:
+        return re.compile(value)
+    except re.error as exception:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is not a valid regular expression: {exception}"
+        ) from exception
+
 
 def parse_command_line() -> argparse.Namespace:
     """Parses command line arguments."""
@@ -681,6 +1042,17 @@ def parse_command_line() -> argparse.Namespace:
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "--jobs",
+        help=(
+            "Number of processes that format files in parallel. "
+            "0 means the number of CPU cores. Messages are printed in the same order "
+            "as when files are processed sequentially."
+        ),
+        required=False,
+        default=1,
+        type=non_negative_int,
+    )
     parser.add_argument(
         "--follow-symlinks",
         help="Follow symlinks when looking for files. By default this option is turned off.",
@@ -698,7 +1070,7 @@ def parse_command_line() -> argparse.Namespace:
             "Example #2: --exclude=\".git/\" excludes all files in the '.git' directory. "
         ),
         required=False,
-        type=str,
+        type=regular_expression,
         default=UNMATCHABLE_REGEX,
     )
     parser.add_argument(